@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+
+
+"""
+Headless batch export of Payoff diagrams
+
+The Payoff diagrams of many trades are rendered to PNG/SVG files with the
+non-interactive Agg canvas. The pyplot global state is not used: one
+figure is created per exporter (per worker process) and its axes and line
+are reused for every chart.
+
+| Input parameter(s):   jobs, out_dir, fmt, max_workers
+|                       eg. chart_jobs(fw_obj, res_list, 20), "charts", "png", 4
+
+jobs:           List of (S, low_K, high_K, DTE, IV, rate, strategy,
+                norm_backend) tuples, chart_jobs() creates them for the
+                top-N ranked trades with the backend of the Framework run.
+                Jobs of several scenarios can be concatenated.
+fmt:            "png" or "svg"
+max_workers:    If given, the rendering is distributed across this many
+                worker processes (the default is rendering in-process).
+
+| Output: List of the file paths (in the order of the jobs). The file names
+          contain every job parameter, duplicate jobs and unknown backends
+          are rejected before rendering.
+"""
+
+
+__author__  = 'Zsolt Forray'
+__license__ = 'MIT'
+__version__ = '0.0.1'
+__date__    = '18/10/2026'
+__status__  = 'Development'
+
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import normal_distribution as nd
+from strategy_spread import chart_data
+from user_defined_exceptions import InvalidDataError
+
+
+class ChartExporter:
+    """
+    Renders Payoff diagrams to files, reusing one figure.
+    """
+    FORMATS = ("png", "svg")
+
+    def __init__(self, out_dir, fmt="png", dpi=100):
+        if fmt not in ChartExporter.FORMATS:
+            raise InvalidDataError("[Error] Invalid chart format")
+        self.out_dir = out_dir
+        self.fmt = fmt
+        self.dpi = dpi
+        self.fig = Figure()
+        FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot(1, 1, 1)
+        self.line, = self.ax.plot([], [])
+        self.ax.set_ylabel("Profit / Loss")
+        self.ax.set_xlabel("Stock Price")
+        self.ax.grid(True)
+
+    @staticmethod
+    def file_name(S, low_K, high_K, DTE, IV, rate, strategy, norm_backend):
+        # Every job parameter is in the name, distinct jobs never share a file
+        return "{}_S{}_DTE{}_IV{}_r{}_K{}-{}_{}".format(strategy, S, DTE, IV, rate,\
+                                                       low_K, high_K, norm_backend)
+
+    def render(self, S, low_K, high_K, DTE, IV, rate, strategy, norm_backend):
+        # The backend of the job, the global one is "scipy" in worker processes
+        stock_price_arr, payoff_arr = chart_data(S, low_K, high_K, DTE, IV, rate,\
+                                                 strategy, nd.get_backend(norm_backend))
+        strategy_name = strategy.replace("_", " ").title()
+        self.line.set_data(stock_price_arr, payoff_arr)
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.ax.set_title("Profit / Loss Profile\nStrategy: {}".format(strategy_name))
+
+        name = ChartExporter.file_name(S, low_K, high_K, DTE, IV, rate, strategy,\
+                                       norm_backend)
+        path = os.path.join(self.out_dir, "{}.{}".format(name, self.fmt))
+        self.fig.savefig(path, format=self.fmt, dpi=self.dpi)
+        return path
+
+    def render_all(self, jobs):
+        return [self.render(*job) for job in jobs]
+
+
+def chart_jobs(fw_obj, res_list, top_n=10):
+    """Chart jobs of the top-N ranked trades of the Framework run"""
+    return [(fw_obj.S, res_row[0], res_row[2], fw_obj.DTE, fw_obj.IV,\
+             fw_obj.rate, fw_obj.strategy, fw_obj.norm_backend)
+            for res_row in res_list[:top_n]]
+
+
+def export_worker(jobs, out_dir, fmt, dpi):
+    exporter = ChartExporter(out_dir, fmt, dpi)
+    return exporter.render_all(jobs)
+
+
+def export_charts(jobs, out_dir, fmt="png", dpi=100, max_workers=None):
+    if fmt not in ChartExporter.FORMATS:
+        raise InvalidDataError("[Error] Invalid chart format")
+    file_names = [ChartExporter.file_name(*job) for job in jobs]
+    if len(set(file_names)) != len(file_names):
+        raise InvalidDataError("[Error] Duplicate chart jobs")
+    # Unknown backends are rejected here, not in a worker process
+    for norm_backend in set(job[7] for job in jobs):
+        nd.get_backend(norm_backend)
+    os.makedirs(out_dir, exist_ok=True)
+    if not max_workers or not jobs:
+        return export_worker(jobs, out_dir, fmt, dpi)
+
+    # One chunk per worker, so every process creates a single figure
+    chunk_size = -(-len(jobs) // max_workers)
+    chunks = [jobs[i:i+chunk_size] for i in range(0, len(jobs), chunk_size)]
+    path_list = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for paths in executor.map(export_worker, chunks,\
+                                  [out_dir] * len(chunks), [fmt] * len(chunks),\
+                                  [dpi] * len(chunks)):
+            path_list.extend(paths)
+    return path_list
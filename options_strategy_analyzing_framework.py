@@ -10,7 +10,8 @@ Options Strategy Analyzing Framework
 
 The best options strategy is selected based on the largest Expected Result (ER).
 
-| Input parameter(s):   S, DTE, IV, rate, strategy, show_chart
+| Input parameter(s):   S, DTE, IV, rate, strategy, show_chart, norm_backend,
+|                       n_threads
 |                       eg. 40.0, 30.0, 40.0, 2.5136, "bull_put_spread", True
 
 Strategy: Currently Available Spread Options Strategies
@@ -24,6 +25,13 @@ DTE:        Number of days to expiration (1-360).
 IV:         Estimated future volatility of a security's price (10-150).
 rate:       Risk-free interest rate (1-4).
 show_chart: If `True`, the "Payoff diagram" is shown.
+norm_backend: Normal distribution backend, "scipy" (default), "special"
+            or "table" (see normal_distribution.py for the accuracy).
+n_threads:  If given, at most this many threads evaluate the strike pairs
+            (the default is a single chunk). The strikes are priced once,
+            the threads only run the array operations of chunks of at least
+            MIN_CHUNK pairs. The default strike range (about 200 pairs) is
+            always evaluated as a single chunk.
 
 | Output: Lists of trade opportunities having parameters as:
           0: Lower Strike
@@ -52,8 +60,13 @@ __status__  = 'Development'
 
 import numpy as np
 from itertools import product
+from concurrent.futures import ThreadPoolExecutor
 import matplotlib.pyplot as plt
-from strategy_spread import Spread
+import normal_distribution as nd
+from strategy_spread import evaluate_spreads
+from strategy_spread import evaluate_priced_spreads
+from strategy_spread import strike_prices
+from strategy_spread import chart_data as spread_chart_data
 from user_defined_exceptions import NoTradeFoundError
 from user_defined_exceptions import InvalidStrategyError
 from user_defined_exceptions import InvalidDataError
@@ -63,13 +76,19 @@ class Framework:
     """
     Main class for options strategy calculation.
     """
-    def __init__(self, S, DTE, IV, rate, strategy, show_chart):
+    # Smallest chunk of a thread, shorter arrays hold the GIL most of the time
+    MIN_CHUNK = 10000
+
+    def __init__(self, S, DTE, IV, rate, strategy, show_chart, norm_backend="scipy",\
+                 n_threads=None):
         self.S = S
         self.DTE = DTE
         self.IV = IV
         self.rate = rate
         self.strategy = strategy
         self.show_chart = show_chart
+        self.norm_backend = norm_backend
+        self.n_threads = n_threads
 
     def create_strike_pairs(self):
         """Creates list of strike pairs for options strategies"""
@@ -99,16 +118,40 @@ class Framework:
         # The second one represents the higher one.
         return strike_list
 
+    def evaluate_strike_pairs(self, strike_pairs, norm):
+        """Result rows of the strike pairs (stateless, thread-safe)"""
+        if len(strike_pairs) == 0:
+            return []
+        Klower, Khigher = zip(*strike_pairs)
+        return evaluate_spreads(self.S, Klower, Khigher, self.DTE, self.IV,\
+                                self.rate, self.strategy, norm)
+
+    def scan_strike_pairs(self, strike_pairs):
+        # The backend is passed down explicitly, no global state is changed
+        norm = nd.get_backend(self.norm_backend)
+        n_chunks = min(self.n_threads or 1,\
+                       -(-len(strike_pairs) // Framework.MIN_CHUNK))
+        if n_chunks <= 1:
+            return self.evaluate_strike_pairs(strike_pairs, norm)
+
+        # One pricing pass for every chunk, the threads only run array operations
+        low_K_arr, high_K_arr = np.array(strike_pairs, dtype=np.float64).T
+        price_arr = strike_prices(self.S, np.concatenate([low_K_arr, high_K_arr]),\
+                                  self.DTE, self.IV, self.rate, self.strategy, norm)
+        chunks = zip(np.array_split(low_K_arr, n_chunks),\
+                     np.array_split(price_arr[:len(low_K_arr)], n_chunks),\
+                     np.array_split(high_K_arr, n_chunks),\
+                     np.array_split(price_arr[len(low_K_arr):], n_chunks))
+        with ThreadPoolExecutor(max_workers=n_chunks) as executor:
+            futures = [executor.submit(evaluate_priced_spreads, self.S, *chunk,\
+                                       self.DTE, self.IV, self.strategy, norm)
+                       for chunk in chunks]
+            return np.concatenate([future.result() for future in futures]).tolist()
+
     def get_all_results(self, strike_pairs):
         """Results are sorted from the highest ER to the lowest"""
         res_list = []
-        for vals in strike_pairs:
-            Klower = vals[0]
-            Khigher = vals[1]
-            spread_obj = Spread(self.S, Klower, Khigher, self.DTE, self.IV,\
-                                self.rate, self.strategy)
-            res_row = spread_obj.run_strategy()
-
+        for res_row in self.scan_strike_pairs(strike_pairs):
             low_price = res_row[1]
             high_price = res_row[3]
             ER = res_row[-1]
@@ -129,9 +172,10 @@ class Framework:
             selected_Klower = res_list[0][0]
             selected_Khigher = res_list[0][2]
             # Calculates the Profit/Loss curve for the selected trade
-            spread_obj = Spread(self.S, selected_Klower, selected_Khigher,\
-                                self.DTE, self.IV, self.rate, self.strategy)
-            stock_price_arr, payoff_arr = spread_obj.collect_chart_data()
+            stock_price_arr, payoff_arr = spread_chart_data(self.S, selected_Klower,\
+                                          selected_Khigher, self.DTE, self.IV,\
+                                          self.rate, self.strategy,\
+                                          nd.get_backend(self.norm_backend))
             chart_data = [stock_price_arr, payoff_arr]
         return chart_data
 
@@ -0,0 +1,222 @@
+#!/usr/bin/python3
+
+
+"""
+Parallel scenario sweep with shared-memory result aggregation
+
+The Framework scan is run for many scenarios in worker processes. The
+workers write the ranked trade rows straight into a preallocated
+shared-memory array indexed by scenario, so only the scenario index is
+pickled back to the parent process.
+
+| Input parameter(s):   scenarios, strategy, top_n, max_workers, norm_backend
+|                       eg. [(40, 30, 40, 2.5136), (50, 60, 35, 2.5136)],
+|                           "bull_put_spread", 10, 4, "scipy"
+
+scenarios:      List of (S, DTE, IV, rate) tuples.
+top_n:          Number of the highest ER trades kept per scenario
+                (all trades are kept by default).
+
+| Output: SweepResult, use it as a context manager (or call close()) to
+          release the shared-memory segments. Closing is refused with a
+          BufferError while views returned by trades() are alive, copy
+          the rows that are needed after closing. If the with block raises,
+          or the result is dropped without closing, the segments are
+          released when the last view is gone.
+          trades(i) returns the ranked rows (see Framework) of scenario i
+          as a read-only view of the shared array, count_arr[i] is the
+          number of rows, -1 if the input parameters of the scenario are
+          invalid.
+
+Remark: If a worker fails, the shared-memory segments are released and
+        the error is raised in the parent process.
+"""
+
+
+__author__  = 'Zsolt Forray'
+__license__ = 'MIT'
+__version__ = '0.0.1'
+__date__    = '18/10/2026'
+__status__  = 'Development'
+
+
+import sys
+import weakref
+import numpy as np
+import option_pricing_black_scholes as bs
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import normal_distribution as nd
+from options_strategy_analyzing_framework import Framework
+from user_defined_exceptions import NoTradeFoundError
+from user_defined_exceptions import InvalidStrategyError
+from user_defined_exceptions import InvalidDataError
+
+
+ROW_LEN = 10        # number of parameters in a result row (see Framework)
+INVALID = -1        # row count of scenarios with invalid input parameters
+
+
+class SweepResult:
+    """
+    Owns the shared-memory segments of a sweep and exposes them as arrays.
+    """
+    def __init__(self, res_shm, count_shm, n_scenarios, max_rows):
+        self.res_shm = res_shm
+        self.count_shm = count_shm
+        self.res_arr = np.ndarray((n_scenarios, max_rows, ROW_LEN),\
+                                  dtype=np.float64, buffer=res_shm.buf)
+        self.count_arr = np.ndarray((n_scenarios,), dtype=np.int64,\
+                                    buffer=count_shm.buf)
+        # Every view of the arrays refers to them as its base, so a segment
+        # is released by the finalizer of its array only when the result
+        # and all views are gone (or at exit), never under a live view.
+        # The same base references are counted to detect live views, this
+        # relies on the reference counting of CPython (sys.getrefcount).
+        self.finalizers = [weakref.finalize(self.res_arr, release_segments, [res_shm]),\
+                           weakref.finalize(self.count_arr, release_segments, [count_shm])]
+        self.array_refs = SweepResult.count_refs(self.res_arr, self.count_arr)
+
+    def __len__(self):
+        return self.count_arr.shape[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            # The exception of the block is not masked, the segments are
+            # released when the views are gone.
+            self.detach()
+
+    @staticmethod
+    def count_refs(res_arr, count_arr):
+        return sys.getrefcount(res_arr), sys.getrefcount(count_arr)
+
+    @property
+    def closed(self):
+        return self.res_arr is None
+
+    @property
+    def views_alive(self):
+        if self.closed:
+            return False
+        return SweepResult.count_refs(self.res_arr, self.count_arr) != self.array_refs
+
+    def trades(self, i):
+        """Ranked trade rows of the scenario (zero-copy view)"""
+        if self.closed:
+            raise ValueError("[Error] The sweep result is closed")
+        rows = self.res_arr[i, :max(self.count_arr[i], 0)]
+        rows.flags.writeable = False
+        return rows
+
+    def detach(self):
+        """
+        Closes the result, the segments are released by the finalizers as
+        soon as no view refers to them.
+        """
+        self.res_arr = None
+        self.count_arr = None
+
+    def close(self):
+        """
+        Releases the shared memory. Refused while views of the arrays are
+        alive, reading them afterwards would access unmapped memory.
+        """
+        if self.closed:
+            return
+        if self.views_alive:
+            raise BufferError("[Error] Views of the sweep result are still in use,"\
+                              " copy the rows to keep them after closing")
+        self.detach()
+        for finalizer in self.finalizers:
+            finalizer()
+
+
+def release_segments(segments):
+    for shm in segments:
+        shm.close()
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def count_max_rows(scenarios, strategy):
+    max_rows = 0
+    for S, DTE, IV, rate in scenarios:
+        fw_obj = Framework(S, DTE, IV, rate, strategy, False)
+        try:
+            max_rows = max(max_rows, len(fw_obj.create_strike_pairs()))
+        except InvalidDataError:
+            pass
+    return max_rows
+
+
+def sweep_worker(i, scenario, strategy, top_n, norm_backend,\
+                 res_name, count_name, n_scenarios, max_rows):
+    """Runs one scenario and writes its rows into the shared arrays"""
+    res_shm = shared_memory.SharedMemory(name=res_name)
+    count_shm = shared_memory.SharedMemory(name=count_name)
+    try:
+        res_arr = np.ndarray((n_scenarios, max_rows, ROW_LEN),\
+                             dtype=np.float64, buffer=res_shm.buf)
+        count_arr = np.ndarray((n_scenarios,), dtype=np.int64,\
+                               buffer=count_shm.buf)
+        S, DTE, IV, rate = scenario
+        fw_obj = Framework(S, DTE, IV, rate, strategy, False, norm_backend)
+        try:
+            res_list = fw_obj.get_all_results(fw_obj.create_strike_pairs())
+            res_list = res_list[:top_n]
+            res_arr[i, :len(res_list)] = res_list
+            count_arr[i] = len(res_list)
+        except NoTradeFoundError:
+            count_arr[i] = 0
+        except (InvalidDataError, bs.InvalidDataError):
+            # Option pricing checks DTE, IV and rate with its own error
+            count_arr[i] = INVALID
+        del res_arr, count_arr
+    finally:
+        res_shm.close()
+        count_shm.close()
+    return i
+
+
+def run_sweep(scenarios, strategy, top_n=None, max_workers=None,\
+              norm_backend="scipy"):
+    if strategy not in ("bull_call_spread", "bull_put_spread"):
+        raise InvalidStrategyError()
+    nd.get_backend(norm_backend)    # checks the backend name
+
+    n_scenarios = len(scenarios)
+    max_rows = count_max_rows(scenarios, strategy)
+    if top_n is not None:
+        max_rows = min(max_rows, top_n)
+
+    # size must be positive even for an empty sweep
+    res_size = max(n_scenarios * max_rows * ROW_LEN * 8, 1)
+    count_size = max(n_scenarios * 8, 1)
+    res_shm = shared_memory.SharedMemory(create=True, size=res_size)
+    try:
+        count_shm = shared_memory.SharedMemory(create=True, size=count_size)
+    except Exception:
+        release_segments([res_shm])
+        raise
+
+    result = SweepResult(res_shm, count_shm, n_scenarios, max_rows)
+    result.count_arr[:] = 0
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(sweep_worker, i, scenario, strategy, top_n,\
+                                       norm_backend, res_shm.name, count_shm.name,\
+                                       n_scenarios, max_rows)
+                       for i, scenario in enumerate(scenarios)]
+            for future in futures:
+                future.result()
+    except BaseException:
+        result.close()
+        raise
+    return result
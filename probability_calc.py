@@ -14,7 +14,136 @@ __status__  = 'Development'
 
 
 import numpy as np
-from scipy.stats import norm as nd
+from collections import namedtuple
+import normal_distribution as nd
+
+
+# Stateless evaluation core, the classes below delegate to these functions.
+# Inputs are not modified and the outputs are immutable, so they are safe to
+# call from several threads. The normal distribution backend (see
+# normal_distribution.py) is passed as `norm`. All formulas work on scalars
+# and on arrays of trades as well (np.round is what round() does on numpy
+# scalars, so both give the same values).
+
+# Immutable result of the probability & expected result calculation
+ProbabilityResult = namedtuple("ProbabilityResult",\
+                               ["period_vol", "z_list", "PR_list", "Nx_list",\
+                                "ER_list", "ER", "PR_gain", "PR_loss",\
+                                "maxGain", "maxLoss"])
+
+
+def period_volatility(IV, DTE):
+    return IV / 100 * np.sqrt(DTE / 365)
+
+
+def z_values(S, bep, high_K, low_K, period_vol):
+    z0 = -4
+    z1 = np.log(low_K / S) / period_vol
+    z2 = np.log(bep / S) / period_vol
+    z3 = np.log(high_K / S) / period_vol
+    z4 = 4
+    return (z0, z1, z2, z3, z4)
+
+
+def sections_probability(z_list, norm):
+    N_list = [norm.cdf(z) for z in z_list]
+    PR01 = N_list[1] - N_list[0]
+    PR12 = N_list[2] - N_list[1]
+    PR23 = N_list[3] - N_list[2]
+    PR34 = N_list[4] - N_list[3]
+    return (PR01, PR12, PR23, PR34)
+
+
+def Nx_values(z_list, period_vol, norm):
+    # Nx01 and Nx34 are not used by the Expected Result formulas
+    N_list = [norm.cdf(z - period_vol) for z in z_list[1:4]]
+    Nx12 = N_list[1] - N_list[0]
+    Nx23 = N_list[2] - N_list[1]
+    return (Nx12, Nx23)
+
+
+def bull_call_ER(S, Ksc, bep, sc, lc, period_vol, PR_list, Nx_list):
+    # Expected Value
+    ER1 = (sc - lc) * PR_list[0]
+    ER2 = S * np.exp(period_vol**2 / 2) * Nx_list[0] - bep * PR_list[1]
+    ER3 = S * np.exp(period_vol**2 / 2) * Nx_list[1] - bep * PR_list[2]
+    ER4 = (Ksc - bep) * PR_list[3]
+    return (ER1, ER2, ER3, ER4)
+
+
+def bull_put_ER(S, Klp, bep, sp, lp, period_vol, PR_list, Nx_list):
+    # Expected Value
+    ER1 = (Klp - bep) * PR_list[0]
+    ER2 = S * np.exp(period_vol**2 / 2) * Nx_list[0] - bep * PR_list[1]
+    ER3 = S * np.exp(period_vol**2 / 2) * Nx_list[1] - bep * PR_list[2]
+    ER4 = (sp - lp) * PR_list[3]
+    return (ER1, ER2, ER3, ER4)
+
+
+def expected_result(S, high_price, low_price, bep, high_K, low_K, strategy,\
+                    period_vol, PR_list, Nx_list):
+    strategies = \
+    {
+        "bull_call_spread"  : \
+        lambda : bull_call_ER(S, high_K, bep, high_price, low_price, period_vol,\
+                              PR_list, Nx_list),
+        "bull_put_spread"   : \
+        lambda : bull_put_ER(S, low_K, bep, high_price, low_price, period_vol,\
+                             PR_list, Nx_list),
+    }
+    return strategies[strategy]()
+
+
+def gain_probability(ER_list, PR_list):
+    # ER of the section and not the total ER decides, the sections with
+    # ER <= 0 add exactly zero
+    return sum(PR * (ER > 0) for ER, PR in zip(ER_list, PR_list))
+
+
+def gain_loss_probability(ER_list, PR_list):
+    # Probability of Gain / Loss
+    PR_gain = np.round(gain_probability(ER_list, PR_list),3)
+    PR_loss = np.round(1 - PR_gain,3)
+    return PR_gain, PR_loss
+
+
+def bull_call_gain_loss(Ksc, bep, sc, lc):
+    maxGain = np.round(Ksc - bep,2)
+    maxLoss = np.round(sc - lc,2)
+    return maxGain, maxLoss
+
+
+def bull_put_gain_loss(Klp, bep, sp, lp):
+    maxGain = np.round(sp - lp,2)
+    maxLoss = np.round(Klp - bep,2)
+    return maxGain, maxLoss
+
+
+def max_gain_loss(high_price, low_price, bep, high_K, low_K, strategy):
+    strategies = \
+    {
+        "bull_call_spread"  : \
+        lambda : bull_call_gain_loss(high_K, bep, high_price, low_price),
+        "bull_put_spread"   : \
+        lambda : bull_put_gain_loss(low_K, bep, high_price, low_price),
+    }
+    return strategies[strategy]()
+
+
+def evaluate_probability(S, high_price, low_price, bep, high_K, low_K,\
+                         DTE, IV, strategy, norm):
+    period_vol = period_volatility(IV, DTE)
+    z_list = z_values(S, bep, high_K, low_K, period_vol)
+    PR_list = sections_probability(z_list, norm)
+    Nx_list = Nx_values(z_list, period_vol, norm)
+    ER_list = expected_result(S, high_price, low_price, bep, high_K, low_K,\
+                              strategy, period_vol, PR_list, Nx_list)
+    ER = np.round(sum(ER_list),3)
+    PR_gain, PR_loss = gain_loss_probability(ER_list, PR_list)
+    maxGain, maxLoss = max_gain_loss(high_price, low_price, bep, high_K, low_K,\
+                                     strategy)
+    return ProbabilityResult(period_vol, z_list, PR_list, Nx_list, ER_list, ER,\
+                             PR_gain, PR_loss, maxGain, maxLoss)
 
 
 class Probability:
@@ -35,59 +164,36 @@ class Probability:
 
     def calc_period_volatility(self):
         # Period Volatility
-        self.period_vol = self.IV / 100 * np.sqrt(self.DTE / 365)
+        self.period_vol = period_volatility(self.IV, self.DTE)
 
     def calc_z_values(self):
         # z-values
-        z0 = -4
-        z1 = np.log(self.low_K / self.S) / self.period_vol
-        z2 = np.log(self.bep / self.S) / self.period_vol
-        z3 = np.log(self.high_K / self.S) / self.period_vol
-        z4 = 4
-        self.z_list = [z0, z1, z2, z3, z4]
+        self.z_list = z_values(self.S, self.bep, self.high_K, self.low_K,\
+                               self.period_vol)
 
     def calc_sections_probability(self):
         # Sections probability
-        PR01 = nd.cdf(self.z_list[1]) - nd.cdf(self.z_list[0])
-        PR12 = nd.cdf(self.z_list[2]) - nd.cdf(self.z_list[1])
-        PR23 = nd.cdf(self.z_list[3]) - nd.cdf(self.z_list[2])
-        PR34 = nd.cdf(self.z_list[4]) - nd.cdf(self.z_list[3])
-        self.PR_list = [PR01, PR12, PR23, PR34]
+        self.PR_list = sections_probability(self.z_list, nd.get_backend())
 
     def calc_Nx_values(self):
-        # Nx01 = None
-        Nx12 = nd.cdf(self.z_list[2] - self.period_vol)\
-                      - nd.cdf(self.z_list[1] - self.period_vol)
-        Nx23 = nd.cdf(self.z_list[3] - self.period_vol)\
-                      - nd.cdf(self.z_list[2] - self.period_vol)
-        # Nx34 = nd.cdf(self.z_list[4] - self.period_vol)\
-        #               - nd.cdf(self.z_list[3] - self.period_vol)
-        self.Nx_list = [Nx12, Nx23]
+        self.Nx_list = Nx_values(self.z_list, self.period_vol, nd.get_backend())
 
     def calc_expected_result(self):
-        # Call ExpectedResult class
-        er_obj = ExpectedResult(self.S, self.high_price, self.low_price,\
-                                self.bep, self.high_K, self.low_K, self.strategy,\
-                                self.period_vol, self.PR_list, self.Nx_list)
-        ER_list = er_obj.run_expected_result_calc()
+        ER_list = expected_result(self.S, self.high_price, self.low_price,\
+                                  self.bep, self.high_K, self.low_K, self.strategy,\
+                                  self.period_vol, self.PR_list, self.Nx_list)
         # Expected Result
         self.ER = round(sum(ER_list),3)
         # Collects Expected Results and Probabilities Values
         self.ER_PR_arr = np.array([ER_list, self.PR_list])
 
     def calc_gain_loss_probability(self):
-        # ER and not self.ER in the list comprehension!!!
-        PR_pos_list =\
-        [self.ER_PR_arr[1][i] for i, ER in enumerate(self.ER_PR_arr[0]) if ER > 0]
-        # Probability of Gain / Loss
-        self.PR_gain = round(sum(PR_pos_list),3)
-        self.PR_loss = round(1 - self.PR_gain,3)
+        self.PR_gain, self.PR_loss = \
+        gain_loss_probability(self.ER_PR_arr[0], self.ER_PR_arr[1])
 
     def calc_max_gain_loss(self):
-        # Call GainLoss class
-        gain_loss_obj = GainLoss(self.high_price, self.low_price, self.bep,\
-                                 self.high_K, self.low_K, self.strategy)
-        self.maxGain, self.maxLoss = gain_loss_obj.run_gain_loss_calc()
+        self.maxGain, self.maxLoss = max_gain_loss(self.high_price, self.low_price,\
+                                     self.bep, self.high_K, self.low_K, self.strategy)
 
     def run_probability(self):
         self.calc_period_volatility()
@@ -119,36 +225,12 @@ class ExpectedResult:
         self.Nx_list = Nx_list
 
     def run_expected_result_calc(self):
-        strategies = \
-        {
-            "bull_call_spread"  : \
-            lambda : ExpectedResult.bull_call_ER(self.S, self.high_K, self.bep,\
-            self.high_price, self.low_price, self.period_vol, self.PR_list, self.Nx_list),
-            "bull_put_spread"   : \
-            lambda : ExpectedResult.bull_put_ER(self.S, self.low_K, self.bep,\
-            self.high_price, self.low_price, self.period_vol, self.PR_list, self.Nx_list),
-        }
-        return strategies[self.strategy]()
-
-    @staticmethod
-    def bull_call_ER(S, Ksc, bep, sc, lc, period_vol, PR_list, Nx_list):
-        # Expected Value
-        ER1 = (sc - lc) * PR_list[0]
-        ER2 = S * np.exp(period_vol**2 / 2) * Nx_list[0] - bep * PR_list[1]
-        ER3 = S * np.exp(period_vol**2 / 2) * Nx_list[1] - bep * PR_list[2]
-        ER4 = (Ksc - bep) * PR_list[3]
-        ER_list = [ER1, ER2, ER3, ER4]
-        return ER_list
-
-    @staticmethod
-    def bull_put_ER(S, Klp, bep, sp, lp, period_vol, PR_list, Nx_list):
-        # Expected Value
-        ER1 = (Klp - bep) * PR_list[0]
-        ER2 = S * np.exp(period_vol**2 / 2) * Nx_list[0] - bep * PR_list[1]
-        ER3 = S * np.exp(period_vol**2 / 2) * Nx_list[1] - bep * PR_list[2]
-        ER4 = (sp - lp) * PR_list[3]
-        ER_list = [ER1, ER2, ER3, ER4]
-        return ER_list
+        return list(expected_result(self.S, self.high_price, self.low_price, self.bep,\
+                                    self.high_K, self.low_K, self.strategy,\
+                                    self.period_vol, self.PR_list, self.Nx_list))
+
+    bull_call_ER = staticmethod(bull_call_ER)
+    bull_put_ER = staticmethod(bull_put_ER)
 
 
 class GainLoss():
@@ -164,25 +246,8 @@ class GainLoss():
         self.strategy = strategy
 
     def run_gain_loss_calc(self):
-        strategies = \
-        {
-            "bull_call_spread"  : \
-            lambda : GainLoss.bull_call_gain_loss(self.high_K, self.bep,\
-                                                  self.high_price, self.low_price),
-            "bull_put_spread"   : \
-            lambda : GainLoss.bull_put_gain_loss(self.low_K, self.bep,\
-                                                 self.high_price, self.low_price),
-        }
-        return strategies[self.strategy]()
-
-    @staticmethod
-    def bull_call_gain_loss(Ksc, bep, sc, lc):
-        maxGain = round(Ksc - bep,2)
-        maxLoss = round(sc - lc,2)
-        return maxGain, maxLoss
-
-    @staticmethod
-    def bull_put_gain_loss(Klp, bep, sp, lp):
-        maxGain = round(sp - lp,2)
-        maxLoss = round(Klp - bep,2)
-        return maxGain, maxLoss
+        return max_gain_loss(self.high_price, self.low_price, self.bep,\
+                             self.high_K, self.low_K, self.strategy)
+
+    bull_call_gain_loss = staticmethod(bull_call_gain_loss)
+    bull_put_gain_loss = staticmethod(bull_put_gain_loss)
@@ -0,0 +1,131 @@
+#!/usr/bin/python3
+
+
+"""
+Sensitivity analysis of the ranked trades
+
+The Expected Result (ER), the Probability of Gain and the option values of
+the two legs are differentiated w.r.t. IV, S and DTE for all trades of
+Framework.get_all_results at once. The scenario is repriced with central
+differences (bump-and-reprice) with the formulas of the ranking (see
+option_pricing_black_scholes.call_value and probability_calc), evaluated
+on arrays of trades.
+
+| Input parameter(s):   S, DTE, IV, rate, strategy, norm_backend
+|                       eg. 40.0, 30.0, 40.0, 2.5136, "bull_put_spread", "scipy"
+
+| Output: 2-D array, one row per trade (same order as the ranked trades),
+          empty if there is no trade (None or empty list):
+          0: Lower Strike
+          1: Higher Strike
+          2: dER / dIV
+          3: dER / dS
+          4: dER / dDTE
+          5: dPR_gain / dIV
+          6: dPR_gain / dS
+          7: dPR_gain / dDTE
+          8: dLower Options Value / dIV
+          9: dLower Options Value / dS
+         10: dLower Options Value / dDTE
+         11: dHigher Options Value / dIV
+         12: dHigher Options Value / dS
+         13: dHigher Options Value / dDTE
+
+Remark: Sensitivities are given per 1 IV point (%), per 1 unit of stock
+        price and per 1 day to expiration. The unrounded values are used,
+        so the results are not affected by the rounding of the prices.
+"""
+
+
+__author__  = 'Zsolt Forray'
+__license__ = 'MIT'
+__version__ = '0.0.1'
+__date__    = '18/10/2026'
+__status__  = 'Development'
+
+
+import numpy as np
+import normal_distribution as nd
+from strategy_spread import option_values
+from strategy_spread import break_even_value
+from probability_calc import period_volatility
+from probability_calc import z_values
+from probability_calc import sections_probability
+from probability_calc import Nx_values
+from probability_calc import expected_result
+from probability_calc import gain_probability
+from user_defined_exceptions import InvalidStrategyError
+from user_defined_exceptions import InvalidDataError
+
+
+class Sensitivity:
+    """
+    Batched sensitivities of the ranked trades.
+    """
+    IV_BUMP = 0.25      # IV points
+    S_BUMP = 0.05       # stock price
+    DTE_BUMP = 0.25     # days
+
+    def __init__(self, S, DTE, IV, rate, strategy, norm_backend="scipy"):
+        self.S = S
+        self.DTE = DTE
+        self.IV = IV
+        self.rate = rate
+        self.strategy = strategy
+        self.norm = nd.get_backend(norm_backend)
+
+    def calc_metrics(self, low_K, high_K, S, DTE, IV):
+        """Leg values, ER and PR_gain of all trades for one scenario"""
+        # Same formulas as the ranking of the trades, without the rounding
+        low_price = option_values(S, low_K, DTE, IV, self.rate, self.strategy,\
+                                  self.norm)
+        high_price = option_values(S, high_K, DTE, IV, self.rate, self.strategy,\
+                                   self.norm)
+        bep = break_even_value(high_K, low_K, high_price, low_price, self.strategy)
+
+        period_vol = period_volatility(IV, DTE)
+        z_list = z_values(S, bep, high_K, low_K, period_vol)
+        PR_list = sections_probability(z_list, self.norm)
+        Nx_list = Nx_values(z_list, period_vol, self.norm)
+        ER_list = expected_result(S, high_price, low_price, bep, high_K, low_K,\
+                                  self.strategy, period_vol, PR_list, Nx_list)
+        ER = sum(ER_list)
+        PR_gain = gain_probability(ER_list, PR_list)
+        return np.array([ER, PR_gain, low_price, high_price])
+
+    def calc_derivative(self, low_K, high_K, S_bump=0.0, DTE_bump=0.0, IV_bump=0.0):
+        """Central difference of the metrics"""
+        up = self.calc_metrics(low_K, high_K, self.S + S_bump,\
+                               self.DTE + DTE_bump, self.IV + IV_bump)
+        down = self.calc_metrics(low_K, high_K, self.S - S_bump,\
+                                 self.DTE - DTE_bump, self.IV - IV_bump)
+        bump = S_bump + DTE_bump + IV_bump
+        return (up - down) / (2 * bump)
+
+    def run_sensitivity(self, res_list):
+        if self.strategy not in ("bull_call_spread", "bull_put_spread"):
+            raise InvalidStrategyError()
+        # the bumped scenarios must stay in range
+        CONDITIONS = [
+                        self.S <= self.S_BUMP,
+                        self.IV <= self.IV_BUMP,
+                        self.DTE <= 0,
+                        self.rate < 0
+                    ]
+        if any(CONDITIONS):
+            raise InvalidDataError()
+        # Framework.run_app returns None if no trade is found
+        if res_list is None or len(res_list) == 0:
+            return np.empty((0, 14))
+
+        res_arr = np.array(res_list, dtype=np.float64).reshape(-1, 10)
+        low_K = res_arr[:,0]
+        high_K = res_arr[:,2]
+        DTE_bump = min(self.DTE_BUMP, self.DTE / 2)
+
+        d_IV = self.calc_derivative(low_K, high_K, IV_bump=self.IV_BUMP)
+        d_S = self.calc_derivative(low_K, high_K, S_bump=self.S_BUMP)
+        d_DTE = self.calc_derivative(low_K, high_K, DTE_bump=DTE_bump)
+        # rows: (ER, PR_gain, low price, high price) x (IV, S, DTE)
+        d_arr = np.stack([d_IV, d_S, d_DTE], axis=1).reshape(12, -1)
+        return np.column_stack([low_K, high_K, d_arr.T])
@@ -21,7 +21,194 @@ __status__  = 'Development'
 
 import numpy as np
 import option_pricing_black_scholes as bs
-from probability_calc import Probability
+import normal_distribution as nd
+from probability_calc import evaluate_probability
+
+
+# Stateless evaluation core, the classes below delegate to these functions.
+# Inputs are not modified and new objects are returned, so they are safe to
+# call from several threads. The normal distribution backend (see
+# normal_distribution.py) is passed as `norm`.
+
+MULTI = 100     # options multiplier
+CONTRACT = 1    # number of options contract
+
+
+def stock_price_range(low_K, high_K):
+    RNG_STOCK = 15          # Stock price range from the min/max strike price
+    STOCK_PRICE_STEP = 0.5  # step for stock price for the payoff calculation
+    DISTANCE_FROM_STRIKE = RNG_STOCK
+    return np.arange(max(low_K - DISTANCE_FROM_STRIKE,0),
+                     high_K + DISTANCE_FROM_STRIKE + STOCK_PRICE_STEP,
+                     STOCK_PRICE_STEP)
+
+
+def bull_call_prices(S, low_K, high_K, DTE, IV, rate, norm):
+    low_price = bs.call_price(S, low_K, DTE, IV, rate, norm)
+    high_price = bs.call_price(S, high_K, DTE, IV, rate, norm)
+    return low_price, high_price
+
+
+def bull_put_prices(S, low_K, high_K, DTE, IV, rate, norm):
+    low_price = bs.put_price(S, low_K, DTE, IV, rate, norm)
+    high_price = bs.put_price(S, high_K, DTE, IV, rate, norm)
+    return low_price, high_price
+
+
+def option_prices(S, low_K, high_K, DTE, IV, rate, strategy, norm):
+    strategies = \
+    {
+        "bull_call_spread"  : bull_call_prices,
+        "bull_put_spread"   : bull_put_prices,
+    }
+    return strategies[strategy](S, low_K, high_K, DTE, IV, rate, norm)
+
+
+def option_values(S, K, DTE, IV, rate, strategy, norm):
+    """
+    Unrounded options values (call/put by the strategy) of strike prices,
+    the parameters can be arrays (sensitivity analysis).
+    """
+    value_func = bs.call_value if strategy == "bull_call_spread" else bs.put_value
+    return value_func(S, K, DTE, IV, rate, norm)
+
+
+def bull_call_bep_value(low_K, high_price, low_price):
+    return low_K - high_price + low_price
+
+
+def bull_put_bep_value(high_K, high_price, low_price):
+    return high_K - high_price + low_price
+
+
+def bull_call_bep(low_K, high_price, low_price):
+    return np.round(bull_call_bep_value(low_K, high_price, low_price), 2)
+
+
+def bull_put_bep(high_K, high_price, low_price):
+    return np.round(bull_put_bep_value(high_K, high_price, low_price), 2)
+
+
+def break_even_value(high_K, low_K, high_price, low_price, strategy):
+    """Unrounded Break Even Point (sensitivity analysis)"""
+    strategies = \
+    {
+    "bull_call_spread"  : lambda : bull_call_bep_value(low_K, high_price, low_price),
+    "bull_put_spread"   : lambda : bull_put_bep_value(high_K, high_price, low_price),
+    }
+    return strategies[strategy]()
+
+
+def break_even_point(high_K, low_K, high_price, low_price, strategy):
+    strategies = \
+    {
+    "bull_call_spread"  : lambda : bull_call_bep(low_K, high_price, low_price),
+    "bull_put_spread"   : lambda : bull_put_bep(high_K, high_price, low_price),
+    }
+    return strategies[strategy]()
+
+
+def bull_call_payoff(stock_price_arr, high_K, low_K, bep, high_price, low_price):
+    payoff_list = []
+    for i in stock_price_arr:
+        if i <= low_K:
+            res_at_expiration = (high_price - low_price)
+        elif low_K < i < high_K:
+            res_at_expiration = (i - bep)
+        elif i >= high_K:
+            res_at_expiration = (high_K - bep)
+        payoff_at_exp = res_at_expiration * MULTI * CONTRACT
+        payoff_list.append(payoff_at_exp)
+    payoff_arr = np.array(payoff_list).T
+    return payoff_arr
+
+
+def bull_put_payoff(stock_price_arr, high_K, low_K, bep, high_price, low_price):
+    payoff_list = []
+    for i in stock_price_arr:
+        if i <= low_K:
+            res_at_expiration = (low_K - bep)
+        elif low_K < i < high_K:
+            res_at_expiration = (i - bep)
+        elif i >= high_K:
+            res_at_expiration = (high_price - low_price)
+        payoff_at_exp = res_at_expiration * MULTI * CONTRACT
+        payoff_list.append(payoff_at_exp)
+    payoff_arr = np.array(payoff_list).T
+    return payoff_arr
+
+
+def payoff(stock_price_arr, low_K, high_K, bep, high_price, low_price, strategy):
+    strategies = \
+    {
+        "bull_call_spread"  : bull_call_payoff,
+        "bull_put_spread"   : bull_put_payoff,
+    }
+    return strategies[strategy](stock_price_arr, high_K, low_K, bep,\
+                                high_price, low_price)
+
+
+def evaluate_spread(S, low_K, high_K, DTE, IV, rate, strategy, norm):
+    """Result row of the trade (see Framework) as a tuple"""
+    low_price, high_price = option_prices(S, low_K, high_K, DTE, IV, rate,\
+                                          strategy, norm)
+    bep = break_even_point(high_K, low_K, high_price, low_price, strategy)
+    prob = evaluate_probability(S, high_price, low_price, bep, high_K, low_K,\
+                                DTE, IV, strategy, norm)
+    return (low_K, low_price, high_K, high_price, bep, prob.PR_gain, prob.PR_loss,\
+            prob.maxGain, prob.maxLoss, prob.ER)
+
+
+def strike_prices(S, K_arr, DTE, IV, rate, strategy, norm):
+    """
+    Options values of the strike prices. The options are priced once per
+    unique strike price, the values are the ones of option_prices.
+    """
+    K_arr = np.asarray(K_arr, dtype=np.float64)
+    unique_K_arr, K_idx = np.unique(K_arr, return_inverse=True)
+    price_func = bs.call_price if strategy == "bull_call_spread" else bs.put_price
+    return np.array([price_func(S, K, DTE, IV, rate, norm) for K in unique_K_arr],\
+                    dtype=np.float64)[K_idx]
+
+
+def evaluate_priced_spreads(S, low_K_arr, low_price_arr, high_K_arr, high_price_arr,\
+                            DTE, IV, strategy, norm):
+    """
+    Result rows (array) of already priced trades. Only array operations,
+    the strike prices are not repriced.
+    """
+    bep_arr = break_even_point(high_K_arr, low_K_arr, high_price_arr,\
+                               low_price_arr, strategy)
+    prob = evaluate_probability(S, high_price_arr, low_price_arr, bep_arr,\
+                                high_K_arr, low_K_arr, DTE, IV, strategy, norm)
+    return np.column_stack([low_K_arr, low_price_arr, high_K_arr, high_price_arr,\
+                            bep_arr, prob.PR_gain, prob.PR_loss, prob.maxGain,\
+                            prob.maxLoss, prob.ER]).reshape(-1, 10)
+
+
+def evaluate_spreads(S, low_K_arr, high_K_arr, DTE, IV, rate, strategy, norm):
+    """
+    Result rows of many trades, evaluated on arrays. The values are the
+    same as the ones of evaluate_spread.
+    """
+    low_K_arr = np.asarray(low_K_arr, dtype=np.float64)
+    high_K_arr = np.asarray(high_K_arr, dtype=np.float64)
+    price_arr = strike_prices(S, np.concatenate([low_K_arr, high_K_arr]), DTE, IV,\
+                              rate, strategy, norm)
+    return evaluate_priced_spreads(S, low_K_arr, price_arr[:len(low_K_arr)],\
+                                   high_K_arr, price_arr[len(low_K_arr):], DTE,\
+                                   IV, strategy, norm).tolist()
+
+
+def chart_data(S, low_K, high_K, DTE, IV, rate, strategy, norm):
+    """Stock prices and Payoff @ EXPIRATION of the trade"""
+    stock_price_arr = stock_price_range(low_K, high_K)
+    low_price, high_price = option_prices(S, low_K, high_K, DTE, IV, rate,\
+                                          strategy, norm)
+    bep = break_even_point(high_K, low_K, high_price, low_price, strategy)
+    payoff_arr = payoff(stock_price_arr, low_K, high_K, bep, high_price, low_price,\
+                        strategy)
+    return stock_price_arr, payoff_arr
 
 
 class Spread:
@@ -38,36 +225,24 @@ class Spread:
         self.strategy = strategy
 
     def calc_stock_price_arr(self):
-        RNG_STOCK = 15          # Stock price range from the min/max strike price
-        STOCK_PRICE_STEP = 0.5  # step for stock price for the payoff calculation
-        DISTANCE_FROM_STRIKE = RNG_STOCK
-        self.stock_price_arr = np.arange(max(self.low_K - DISTANCE_FROM_STRIKE,0),
-                                         self.high_K + DISTANCE_FROM_STRIKE
-                                         + STOCK_PRICE_STEP, STOCK_PRICE_STEP)
+        self.stock_price_arr = stock_price_range(self.low_K, self.high_K)
 
     def calc_option_price(self):
-        price_obj = Price(self.S, self.low_K, self.high_K, self.DTE, self.IV,\
-                          self.rate, self.strategy)
-        self.low_price, self.high_price = price_obj.run_price()
+        self.low_price, self.high_price = option_prices(self.S, self.low_K,\
+                                          self.high_K, self.DTE, self.IV,\
+                                          self.rate, self.strategy, nd.get_backend())
 
     def calc_break_even_point(self):
-        bep_obj = BreakEvenPoint(self.high_K, self.low_K,\
-                                 self.high_price, self.low_price, self.strategy)
-        self.bep = bep_obj.run_bep()
+        self.bep = break_even_point(self.high_K, self.low_K,\
+                                    self.high_price, self.low_price, self.strategy)
 
     def calc_payoff(self):
-        pay_obj = Payoff(self.stock_price_arr, self.low_K, self.high_K, self.bep,\
-                         self.high_price, self.low_price, self.strategy)
-        self.payoff_arr =  pay_obj.run_payoff()
+        self.payoff_arr = payoff(self.stock_price_arr, self.low_K, self.high_K,\
+                                 self.bep, self.high_price, self.low_price, self.strategy)
 
     def run_strategy(self):
-        self.calc_stock_price_arr()
-        self.calc_option_price()
-        self.calc_break_even_point()
-        self.calc_payoff()
-        prob_obj = Probability(self.S, self.high_price, self.low_price, self.bep,\
-                               self.high_K, self.low_K, self.DTE, self.IV, self.strategy)
-        return prob_obj.run_probability()
+        return list(evaluate_spread(self.S, self.low_K, self.high_K, self.DTE,\
+                                    self.IV, self.rate, self.strategy, nd.get_backend()))
 
     def collect_chart_data(self):
         self.calc_stock_price_arr()
@@ -91,30 +266,16 @@ class Price:
         self.strategy = strategy
 
     def run_price(self):
-        strategies = \
-        {
-            "bull_call_spread"  : lambda : Price.bull_call_prices(self.S, self.low_K,\
-                                           self.high_K, self.DTE, self.IV, self.rate),
-            "bull_put_spread"   : lambda : Price.bull_put_prices(self.S, self.low_K,\
-                                           self.high_K, self.DTE, self.IV, self.rate),
-        }
-        return strategies[self.strategy]()
+        return option_prices(self.S, self.low_K, self.high_K, self.DTE, self.IV,\
+                             self.rate, self.strategy, nd.get_backend())
 
     @staticmethod
     def bull_call_prices(S, low_K, high_K, DTE, IV, rate):
-        price_obj = bs.OptionPrice(S, low_K, DTE, IV, rate)
-        low_price = price_obj.call_price()
-        price_obj = bs.OptionPrice(S, high_K, DTE, IV, rate)
-        high_price = price_obj.call_price()
-        return low_price, high_price
+        return bull_call_prices(S, low_K, high_K, DTE, IV, rate, nd.get_backend())
 
     @staticmethod
     def bull_put_prices(S, low_K, high_K, DTE, IV, rate):
-        price_obj = bs.OptionPrice(S, low_K, DTE, IV, rate)
-        low_price = price_obj.put_price()
-        price_obj = bs.OptionPrice(S, high_K, DTE, IV, rate)
-        high_price = price_obj.put_price()
-        return low_price, high_price
+        return bull_put_prices(S, low_K, high_K, DTE, IV, rate, nd.get_backend())
 
 
 class BreakEvenPoint:
@@ -129,22 +290,11 @@ class BreakEvenPoint:
         self.strategy = strategy
 
     def run_bep(self):
-        strategies = \
-        {
-        "bull_call_spread"  : \
-        lambda : BreakEvenPoint.bull_call_bep(self.low_K, self.high_price, self.low_price),
-        "bull_put_spread"   : \
-        lambda : BreakEvenPoint.bull_put_bep(self.high_K, self.high_price, self.low_price),
-        }
-        return strategies[self.strategy]()
-
-    @staticmethod
-    def bull_call_bep(low_K, high_price, low_price):
-        return round(low_K - high_price + low_price, 2)
+        return break_even_point(self.high_K, self.low_K, self.high_price,\
+                                self.low_price, self.strategy)
 
-    @staticmethod
-    def bull_put_bep(high_K, high_price, low_price):
-        return round(high_K - high_price + low_price, 2)
+    bull_call_bep = staticmethod(bull_call_bep)
+    bull_put_bep = staticmethod(bull_put_bep)
 
 
 class Payoff:
@@ -152,8 +302,8 @@ class Payoff:
     Calculates the Result Function (Payoff) @ EXPIRATION
     based on the selected spread strategy.
     """
-    MULTI = 100     # options multiplier
-    CONTRACT = 1    # number of options contract
+    MULTI = MULTI           # options multiplier
+    CONTRACT = CONTRACT     # number of options contract
     def __init__(self, stock_price_arr, low_K, high_K, bep,\
                  high_price, low_price, strategy):
         self.stock_price_arr = stock_price_arr
@@ -165,43 +315,8 @@ class Payoff:
         self.strategy = strategy
 
     def run_payoff(self):
-        strategies = \
-        {
-            "bull_call_spread"  : \
-            lambda : Payoff.bull_call_payoff(self.stock_price_arr, self.high_K, self.low_K,\
-                                             self.bep, self.high_price, self.low_price),
-            "bull_put_spread"   : \
-            lambda : Payoff.bull_put_payoff(self.stock_price_arr, self.high_K, self.low_K,\
-                                            self.bep, self.high_price, self.low_price),
-        }
-        return strategies[self.strategy]()
+        return payoff(self.stock_price_arr, self.low_K, self.high_K, self.bep,\
+                      self.high_price, self.low_price, self.strategy)
 
-    @staticmethod
-    def bull_call_payoff(stock_price_arr, high_K, low_K, bep, high_price, low_price):
-        payoff_list = []
-        for i in stock_price_arr:
-            if i <= low_K:
-                res_at_expiration = (high_price - low_price)
-            elif low_K < i < high_K:
-                res_at_expiration = (i - bep)
-            elif i >= high_K:
-                res_at_expiration = (high_K - bep)
-            payoff_at_exp = res_at_expiration * Payoff.MULTI * Payoff.CONTRACT
-            payoff_list.append(payoff_at_exp)
-        payoff_arr = np.array(payoff_list).T
-        return payoff_arr
-
-    @staticmethod
-    def bull_put_payoff(stock_price_arr, high_K, low_K, bep, high_price, low_price):
-        payoff_list = []
-        for i in stock_price_arr:
-            if i <= low_K:
-                res_at_expiration = (low_K - bep)
-            elif low_K < i < high_K:
-                res_at_expiration = (i - bep)
-            elif i >= high_K:
-                res_at_expiration = (high_price - low_price)
-            payoff_at_exp = res_at_expiration * Payoff.MULTI * Payoff.CONTRACT
-            payoff_list.append(payoff_at_exp)
-        payoff_arr = np.array(payoff_list).T
-        return payoff_arr
+    bull_call_payoff = staticmethod(bull_call_payoff)
+    bull_put_payoff = staticmethod(bull_put_payoff)
@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+
+
+"""
+Tests of the batch Payoff diagram export
+"""
+
+
+__author__  = 'Zsolt Forray'
+__license__ = 'MIT'
+__version__ = '0.0.1'
+__date__    = '18/10/2026'
+__status__  = 'Development'
+
+
+import os
+import tempfile
+import unittest
+import normal_distribution as nd
+from chart_export import ChartExporter
+from chart_export import chart_jobs
+from chart_export import export_charts
+from options_strategy_analyzing_framework import Framework
+from strategy_spread import chart_data
+from user_defined_exceptions import InvalidDataError
+
+
+def top_jobs(rate, top_n=3, norm_backend="scipy"):
+    fw_obj = Framework(40, 30, 40, rate, "bull_put_spread", False, norm_backend)
+    return chart_jobs(fw_obj, fw_obj.run_app(), top_n)
+
+
+class TestExportCharts(unittest.TestCase):
+    def test_scenarios_differing_in_rate_get_own_files(self):
+        jobs = top_jobs(2.5136) + top_jobs(3.5)
+        with tempfile.TemporaryDirectory() as out_dir:
+            path_list = export_charts(jobs, out_dir)
+            self.assertEqual(len(set(path_list)), len(jobs))
+            self.assertTrue(all(os.path.isfile(path) for path in path_list))
+
+    def test_duplicate_jobs_rejected_before_rendering(self):
+        jobs = top_jobs(2.5136)
+        with tempfile.TemporaryDirectory() as out_dir:
+            with self.assertRaises(InvalidDataError):
+                export_charts(jobs + jobs[:1], out_dir)
+            self.assertEqual(os.listdir(out_dir), [])
+
+    def test_jobs_keep_the_backend_of_the_run(self):
+        jobs = top_jobs(2.5136, norm_backend="table")
+        self.assertTrue(all(job[7] == "table" for job in jobs))
+        with tempfile.TemporaryDirectory() as out_dir:
+            exporter = ChartExporter(out_dir)
+            for job in jobs:
+                exporter.render(*job)
+                payoff_arr = chart_data(*job[:7], nd.get_backend("table"))[1]
+                self.assertEqual(exporter.line.get_ydata().tolist(),\
+                                 payoff_arr.tolist())
+            # the backend of the job is used, not the global one
+            with self.assertRaises(InvalidDataError):
+                exporter.render(*jobs[0][:7], "unknown")
+
+    def test_unknown_backend_rejected_before_rendering(self):
+        jobs = top_jobs(2.5136)
+        jobs.append(jobs[0][:7] + ("unknown",))
+        with tempfile.TemporaryDirectory() as out_dir:
+            with self.assertRaises(InvalidDataError):
+                export_charts(jobs, out_dir, max_workers=2)
+            self.assertEqual(os.listdir(out_dir), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+
+
+"""
+Tests of the stateless evaluation core and the thread-pool scan
+"""
+
+
+__author__  = 'Zsolt Forray'
+__license__ = 'MIT'
+__version__ = '0.0.1'
+__date__    = '18/10/2026'
+__status__  = 'Development'
+
+
+import threading
+import unittest
+import normal_distribution as nd
+from options_strategy_analyzing_framework import Framework
+from strategy_spread import Spread
+from strategy_spread import evaluate_spread
+
+
+S, DTE, IV, RATE = SCENARIO = (40, 30, 40, 2.5136)
+STRATEGIES = ("bull_call_spread", "bull_put_spread")
+BACKENDS = ("scipy", "special", "table")
+
+
+class TestEvaluationCore(unittest.TestCase):
+    def test_vectorized_scan_matches_per_pair_evaluation(self):
+        for strategy in STRATEGIES:
+            for backend in BACKENDS:
+                fw_obj = Framework(*SCENARIO, strategy, False, backend)
+                strike_pairs = fw_obj.create_strike_pairs()
+                norm = nd.get_backend(backend)
+                expected = [list(evaluate_spread(S, Klower, Khigher, DTE, IV, RATE,\
+                                                 strategy, norm))
+                            for Klower, Khigher in strike_pairs]
+                self.assertEqual(fw_obj.evaluate_strike_pairs(strike_pairs, norm),\
+                                 expected)
+
+    def test_spread_class_delegates_to_core(self):
+        fw_obj = Framework(*SCENARIO, "bull_put_spread", False)
+        best = fw_obj.run_app()[0]
+        spread_obj = Spread(S, best[0], best[2], DTE, IV, RATE, "bull_put_spread")
+        self.assertEqual(spread_obj.run_strategy(), best)
+
+    def test_chart_data_of_best_trade(self):
+        fw_obj = Framework(*SCENARIO, "bull_put_spread", True)
+        res_list = fw_obj.get_all_results(fw_obj.create_strike_pairs())
+        stock_price_arr, payoff_arr = fw_obj.get_selected_best_result(res_list)
+        self.assertEqual(len(stock_price_arr), len(payoff_arr))
+        # Maximum Gain / Loss of the best trade per contract
+        self.assertAlmostEqual(payoff_arr.max(), res_list[0][7] * 100)
+        self.assertAlmostEqual(payoff_arr.min(), res_list[0][8] * 100)
+
+    def test_thread_scan_matches_sequential_scan(self):
+        for strategy in STRATEGIES:
+            sequential = Framework(*SCENARIO, strategy, False).run_app()
+            for n_threads in (1, 3, 8):
+                fw_obj = Framework(*SCENARIO, strategy, False, n_threads=n_threads)
+                self.assertEqual(fw_obj.run_app(), sequential)
+
+    def test_thread_chunks_of_large_grid_match_sequential_scan(self):
+        strike_list = [K / 10 for K in range(300, 520)]
+        strike_pairs = [(Klower, Khigher) for Klower in strike_list
+                        for Khigher in strike_list if Klower < Khigher]
+        for strategy in STRATEGIES:
+            sequential = Framework(*SCENARIO, strategy, False)\
+                         .scan_strike_pairs(strike_pairs)
+            fw_obj = Framework(*SCENARIO, strategy, False, n_threads=3)
+            self.assertGreater(len(strike_pairs), 2 * Framework.MIN_CHUNK)
+            self.assertEqual(fw_obj.scan_strike_pairs(strike_pairs), sequential)
+
+    def test_concurrent_runs_keep_their_backend(self):
+        expected = {backend: Framework(*SCENARIO, "bull_put_spread", False,\
+                                       backend).run_app()
+                    for backend in ("table", "special")}
+        results = {}
+
+        def run(i, backend):
+            fw_obj = Framework(*SCENARIO, "bull_put_spread", False, backend,\
+                               n_threads=2)
+            results[i] = (backend, fw_obj.run_app())
+
+        threads = [threading.Thread(target=run, args=(i, backend))
+                   for i, backend in enumerate(["table", "special"] * 2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for backend, res_list in results.values():
+            self.assertEqual(res_list, expected[backend])
+        self.assertEqual(nd.get_backend().name, "scipy")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/python3
+
+
+"""
+Tests of the normal distribution backends
+"""
+
+
+__author__  = 'Zsolt Forray'
+__license__ = 'MIT'
+__version__ = '0.0.1'
+__date__    = '18/10/2026'
+__status__  = 'Development'
+
+
+import math
+import unittest
+import numpy as np
+from scipy.special import ndtr
+import normal_distribution as nd
+from user_defined_exceptions import InvalidDataError
+
+
+DOCUMENTED_MAX_ERROR = 5e-8     # see the module docstring and the README
+
+
+class TestTabulatedNormal(unittest.TestCase):
+    def setUp(self):
+        self.table = nd.get_backend("table")
+        # dense grid, beyond both ends of the table
+        self.x_arr = np.linspace(-10, 10, 2000001)
+
+    def test_max_abs_error_cdf(self):
+        error = np.abs(self.table.cdf(self.x_arr) - ndtr(self.x_arr)).max()
+        self.assertLessEqual(error, self.table.max_abs_error)
+        self.assertLessEqual(self.table.max_abs_error, DOCUMENTED_MAX_ERROR)
+
+    def test_max_abs_error_pdf(self):
+        exact = np.exp(-0.5 * self.x_arr**2) / math.sqrt(2 * math.pi)
+        error = np.abs(self.table.pdf(self.x_arr) - exact).max()
+        self.assertLessEqual(error, self.table.max_abs_error)
+
+    def test_scalar_and_array_paths_agree(self):
+        x_arr = self.x_arr[::997]
+        self.assertEqual(self.table.cdf(x_arr).tolist(),\
+                         [self.table.cdf(x) for x in x_arr.tolist()])
+        self.assertEqual(self.table.pdf(x_arr).tolist(),\
+                         [self.table.pdf(x) for x in x_arr.tolist()])
+
+
+class TestBackendsInterchangeable(unittest.TestCase):
+    SPECIAL_VALUES = [-np.inf, np.inf, np.nan]
+
+    def assert_same(self, value, expected):
+        if np.isnan(expected):
+            self.assertTrue(np.isnan(value))
+        else:
+            self.assertEqual(value, expected)
+
+    def test_special_values(self):
+        expected_cdf = [0.0, 1.0, np.nan]
+        expected_pdf = [0.0, 0.0, np.nan]
+        for name in nd.BACKENDS:
+            backend = nd.get_backend(name)
+            cdf_arr = backend.cdf(np.array(self.SPECIAL_VALUES))
+            pdf_arr = backend.pdf(np.array(self.SPECIAL_VALUES))
+            for i, x in enumerate(self.SPECIAL_VALUES):
+                with self.subTest(backend=name, x=x):
+                    self.assert_same(backend.cdf(x), expected_cdf[i])
+                    self.assert_same(backend.pdf(x), expected_pdf[i])
+                    self.assert_same(cdf_arr[i], expected_cdf[i])
+                    self.assert_same(pdf_arr[i], expected_pdf[i])
+
+    def test_unknown_backend(self):
+        with self.assertRaises(InvalidDataError):
+            nd.get_backend("unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
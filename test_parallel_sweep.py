@@ -0,0 +1,118 @@
+#!/usr/bin/python3
+
+
+"""
+Tests of the shared-memory sweep lifecycle
+"""
+
+
+__author__  = 'Zsolt Forray'
+__license__ = 'MIT'
+__version__ = '0.0.1'
+__date__    = '18/10/2026'
+__status__  = 'Development'
+
+
+import gc
+import os
+import unittest
+from multiprocessing import shared_memory
+from parallel_sweep import run_sweep
+from parallel_sweep import INVALID
+from options_strategy_analyzing_framework import Framework
+
+
+SCENARIO = (40, 30, 40, 2.5136)
+
+
+def segment_exists(name):
+    try:
+        shm = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return False
+    shm.close()
+    return True
+
+
+class TestSweepResult(unittest.TestCase):
+    def test_rows_match_framework(self):
+        fw_obj = Framework(*SCENARIO, "bull_put_spread", False)
+        res_list = fw_obj.get_all_results(fw_obj.create_strike_pairs())
+        with run_sweep([SCENARIO, (3, 30, 40, 2.5136)], "bull_put_spread",\
+                       top_n=5, max_workers=1) as res:
+            self.assertEqual(res.trades(0).tolist(), res_list[:5])
+            self.assertEqual(res.count_arr[1], INVALID)
+            self.assertEqual(res.trades(1).shape, (0, 10))
+
+    def test_close_refused_while_views_alive(self):
+        res = run_sweep([SCENARIO], "bull_put_spread", top_n=5, max_workers=1)
+        name = res.res_shm.name
+        top = res.trades(0)
+        row = top[0]
+        with self.assertRaises(BufferError):
+            res.close()
+        # the views are still readable, the segments were not released
+        self.assertEqual(row[0], 35.0)
+        self.assertTrue(segment_exists(name))
+        del top, row
+        res.close()
+        self.assertTrue(res.closed)
+        self.assertFalse(segment_exists(name))
+
+    def test_context_manager_with_copied_rows(self):
+        with run_sweep([SCENARIO], "bull_put_spread", top_n=5, max_workers=1) as res:
+            top = res.trades(0).copy()
+            name = res.res_shm.name
+        self.assertEqual(top[0][0], 35.0)
+        self.assertFalse(segment_exists(name))
+        with self.assertRaises(ValueError):
+            res.trades(0)
+
+    def test_context_manager_refuses_leaked_view(self):
+        with self.assertRaises(BufferError):
+            with run_sweep([SCENARIO], "bull_put_spread", top_n=5, max_workers=1)\
+                 as res:
+                top = res.trades(0)
+        self.assertEqual(top[0][0], 35.0)
+        del top
+        res.close()
+        self.assertTrue(res.closed)
+
+    def test_invalid_pricing_parameters_marked_invalid(self):
+        scenarios = [SCENARIO, (40, 30, 40, -1.0), (40, 0, 40, 2.5), (40, 30, 0, 2.5)]
+        with run_sweep(scenarios, "bull_put_spread", top_n=5, max_workers=1) as res:
+            self.assertEqual(res.count_arr.tolist(), [5, INVALID, INVALID, INVALID])
+
+    def test_exception_in_block_not_masked(self):
+        with self.assertRaises(KeyError):
+            with run_sweep([SCENARIO], "bull_put_spread", top_n=5, max_workers=1)\
+                 as res:
+                name = res.res_shm.name
+                top = res.trades(0)
+                raise KeyError("body")
+        self.assertTrue(res.closed)
+        # the view is still readable, the segments go with the last view
+        self.assertEqual(top[0][0], 35.0)
+        self.assertTrue(segment_exists(name))
+        del top
+        gc.collect()
+        self.assertFalse(segment_exists(name))
+
+    def test_dropped_result_releases_segments(self):
+        res = run_sweep([SCENARIO], "bull_put_spread", top_n=5, max_workers=1)
+        name = res.res_shm.name
+        del res
+        gc.collect()
+        self.assertFalse(segment_exists(name))
+
+    def test_segments_released_when_worker_fails(self):
+        before = set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else None
+        with self.assertRaises(TypeError):
+            run_sweep([SCENARIO, (40, "x", 40, 2.5136)], "bull_put_spread",\
+                      max_workers=1)
+        if before is not None:
+            self.assertEqual(set(os.listdir("/dev/shm")) - before, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
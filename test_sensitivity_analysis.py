@@ -0,0 +1,80 @@
+#!/usr/bin/python3
+
+
+"""
+Tests of the sensitivity analysis of the ranked trades
+"""
+
+
+__author__  = 'Zsolt Forray'
+__license__ = 'MIT'
+__version__ = '0.0.1'
+__date__    = '18/10/2026'
+__status__  = 'Development'
+
+
+import unittest
+import numpy as np
+from option_pricing_black_scholes import OptionGreeks
+from options_strategy_analyzing_framework import Framework
+from sensitivity_analysis import Sensitivity
+
+
+SCENARIO = (40, 30, 40, 2.5136)
+STRATEGIES = ("bull_call_spread", "bull_put_spread")
+# Greeks are rounded to 4 decimals, the bumps add a small difference error
+GREEKS_DELTA = 1e-4
+
+
+def all_trades(S, DTE, IV, rate, strategy):
+    # Unfiltered rows, near the expiration no trade passes the ranking
+    fw_obj = Framework(S, DTE, IV, rate, strategy, False)
+    return fw_obj.scan_strike_pairs(fw_obj.create_strike_pairs())
+
+
+def leg_greeks(S, K, DTE, IV, rate, strategy):
+    """(vega, delta, -theta) of a leg, in the column order of the analysis"""
+    greeks_obj = OptionGreeks(S, K, DTE, IV, rate)
+    if strategy == "bull_call_spread":
+        return greeks_obj.call_vega(), greeks_obj.call_delta(),\
+               -greeks_obj.call_theta()
+    return greeks_obj.put_vega(), greeks_obj.put_delta(), -greeks_obj.put_theta()
+
+
+class TestSensitivity(unittest.TestCase):
+    def assert_legs_match_greeks(self, S, DTE, IV, rate, strategy, delta):
+        res_list = all_trades(S, DTE, IV, rate, strategy)
+        sens_arr = Sensitivity(S, DTE, IV, rate, strategy).run_sensitivity(res_list)
+        self.assertEqual(sens_arr.shape, (len(res_list), 14))
+        for row in sens_arr:
+            for K, first_col in ((row[0], 8), (row[1], 11)):
+                expected = leg_greeks(S, K, DTE, IV, rate, strategy)
+                for col, greek in enumerate(expected, first_col):
+                    with self.subTest(strategy=strategy, K=K, col=col):
+                        self.assertAlmostEqual(row[col], greek, delta=delta)
+
+    def test_leg_columns_match_option_greeks(self):
+        for strategy in STRATEGIES:
+            self.assert_legs_match_greeks(*SCENARIO, strategy, GREEKS_DELTA)
+
+    def test_dte_bump_clamped_near_expiration(self):
+        # DTE - DTE_BUMP < 0, unclamped the bumped down scenario is invalid
+        S, DTE, IV, rate = 40, 0.2, 40, 2.5136
+        self.assertLess(DTE - Sensitivity.DTE_BUMP, 0)
+        for strategy in STRATEGIES:
+            sens_arr = Sensitivity(S, DTE, IV, rate, strategy)\
+                       .run_sensitivity(all_trades(S, DTE, IV, rate, strategy))
+            self.assertTrue(np.isfinite(sens_arr).all())
+        # theta changes fast near the expiration (max. 0.37 per day here),
+        # the central difference is within 0.02 of it
+        self.assert_legs_match_greeks(S, DTE, IV, rate, "bull_put_spread", 0.02)
+
+    def test_no_trade(self):
+        sens_obj = Sensitivity(*SCENARIO, "bull_put_spread")
+        for res_list in (None, []):
+            with self.subTest(res_list=res_list):
+                self.assertEqual(sens_obj.run_sensitivity(res_list).shape, (0, 14))
+
+
+if __name__ == "__main__":
+    unittest.main()